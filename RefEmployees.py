@@ -1,21 +1,167 @@
 from abc import ABC, abstractmethod
-from typing import List
-from datetime import datetime
-import json
+from collections import namedtuple
+import array
+from typing import List, Optional
+import functools
+import io
+import os
+import sys
+import time
+
+# NumPy y Numba son opcionales y lentos de importar: se cargan recién la primera vez que
+# se usan, no al arrancar el CLI. None = aún no se intentó, False = no está instalado.
+_np = None
+_jit_kernels = None
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+# Por debajo de este tamaño la compilación JIT no compensa y se usa NumPy
+_JIT_MIN_BATCH = 1000
+
+def _compile_kernels():
+    try:
+        import numba
+    except ImportError:
+        return None
+    np = _numpy()
+
+    # Sin fastmath: debe redondear igual que calculate_payment
+    @numba.njit(parallel=True, cache=True)
+    def salaried_kernel(salaries, bonus_percent):
+        out = np.empty(salaries.shape[0], dtype=np.float64)
+        for i in numba.prange(salaries.shape[0]):
+            out[i] = salaries[i] + salaries[i] * bonus_percent
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def hourly_kernel(rates, hours, threshold, bonus):
+        out = np.empty(rates.shape[0], dtype=np.float64)
+        for i in numba.prange(rates.shape[0]):
+            b = bonus if hours[i] > threshold else 0.0
+            out[i] = rates[i] * hours[i] + b
+        return out
+
+    return salaried_kernel, hourly_kernel
+
+def _kernels(n):
+    # Devuelve (salaried, hourly) si el lote justifica el JIT y Numba está disponible
+    global _jit_kernels
+    if n < _JIT_MIN_BATCH:
+        return None
+    if _jit_kernels is None:
+        _jit_kernels = _compile_kernels() or False
+    return _jit_kernels or None
+
+def _run_kernel(index, *args):
+    # Si la compilación falla se desactiva el JIT y el llamador usa la versión NumPy
+    global _jit_kernels
+    try:
+        return _jit_kernels[index](*args)
+    except Exception:
+        _jit_kernels = False
+        return None
+
+def _salaried_totals(salaries, bonus_percent):
+    if _kernels(salaries.shape[0]) is not None:
+        totals = _run_kernel(0, salaries, bonus_percent)
+        if totals is not None:
+            return totals
+    return salaries + salaries * bonus_percent
+
+def _hourly_totals(rates, hours, threshold, bonus):
+    if _kernels(rates.shape[0]) is not None:
+        totals = _run_kernel(1, rates, hours, threshold, bonus)
+        if totals is not None:
+            return totals
+    return rates * hours + _numpy().where(hours > threshold, bonus, 0)
+
+# Montos en arreglos contiguos de float64 (ndarray si hay NumPy)
+def _float_array(values):
+    np = _numpy()
+    if np is not None:
+        return np.fromiter(values, dtype=np.float64)
+    return array.array("d", values)
+
+def _project_total(amounts):
+    # sum() secuencial sobre floats de Python, como el cálculo original: mismo redondeo
+    # con o sin NumPy, y 0 (int) si no hay proyectos. ndarray y array('d') tienen tolist().
+    return sum(amounts.tolist())
+
+# Roles internados: son las claves de _VACATION_POLICIES (main.py) y de employees_by_role;
+# Employee internaliza el rol recibido, así que esas búsquedas comparan por identidad primero
+ROLE_MANAGER, ROLE_VP, ROLE_INTERN, ROLE_FREELANCER = map(
+    sys.intern, ("manager", "vice_president", "intern", "freelancer"))
+
+# Registro de transacciones: ts en nanosegundos desde epoch, se formatea al mostrarlo.
+# Employee guarda cada campo en su propia columna; Txn es la vista por fila.
+Txn = namedtuple("Txn", "ts type amount description")
+
+# Último segundo formateado: una nómina registra muchas transacciones en el mismo segundo
+_last_sec = [None, ""]
+
+def _format_ts(ts):
+    sec = ts // 1_000_000_000
+    if sec != _last_sec[0]:
+        from datetime import datetime  # import diferido: solo se necesita al mostrar
+        _last_sec[:] = [sec, datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")]
+    return _last_sec[1]
+
+class VacationError(Exception):
+    __slots__ = ()
 
 # Interfaces de políticas (Bridge)
 
 class VacationPolicy(ABC):
-    @abstractmethod 
-    def request_vacation(self, employee, days: int, payout: bool): pass
+    __slots__ = ()
+
+    # Devuelve el error (instancia precreada), o None si la solicitud es válida (no lanza)
+    @abstractmethod
+    def validate(self, employee, days: int, payout: bool) -> Optional[VacationError]: pass
+
+    def grant(self, employee, days: int, payout: bool): pass
+
+    def request_vacation(self, employee, days: int, payout: bool):
+        error = self.validate(employee, days, payout)
+        if error is not None:
+            # Se lanza una copia: la instancia compartida no debe guardar traceback ni __context__
+            raise VacationError(*error.args)
+        self.grant(employee, days, payout)
+
+    def try_request_vacation(self, employee, days: int, payout: bool) -> Optional[VacationError]:
+        error = self.validate(employee, days, payout)
+        if error is None:
+            self.grant(employee, days, payout)
+        return error
 
 class PaymentPolicy(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def calculate_payment(self, employee): pass
 
+    def calculate_batch(self, employees):
+        # Devuelve un total por empleado, o la excepción si su pago falló
+        totals = []
+        for employee in employees:
+            try:
+                totals.append(self.calculate_payment(employee))
+            except Exception as e:
+                totals.append(e)
+        return totals
+
 # Visitor para operaciones por tipo
 
 class EmployeeVisitor(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def visit_salaried(self, employee): pass
 
@@ -31,152 +177,355 @@ class EmployeeVisitor(ABC):
 # Clase base de Empleado
 
 class Employee(ABC):
+    __slots__ = ("name", "role", "vacation_days", "vacation_policy", "payment_policy",
+                 "_ts", "_types", "_amounts", "_descs", "last_payment")
+
     def __init__(self, name, role, vacation_policy, payment_policy):
+        # Employee es abstracta: solo se instancian subclases que declaran su _VISIT
+        if self._VISIT is None:
+            raise TypeError(f"Can't instantiate {type(self).__name__}: it does not define _VISIT "
+                            "(the visit_* method accept() dispatches to)")
         self.name = name
-        self.role = role
+        self.role = sys.intern(role)
         self.vacation_days = 10
         self.vacation_policy = vacation_policy
         self.payment_policy = payment_policy
-        self.transactions: List[dict] = []
+        self._ts = array.array("q")
+        self._types: List[str] = []
+        self._amounts: list = []  # lista: conserva int/float tal como se registró
+        self._descs: List[str] = []
+        self.last_payment = None
 
     def request_vacation(self, days: int, payout: bool):
         self.vacation_policy.request_vacation(self, days, payout)
 
+    def try_request_vacation(self, days: int, payout: bool) -> Optional[VacationError]:
+        return self.vacation_policy.try_request_vacation(self, days, payout)
+
     def calculate_payment(self):
-        return self.payment_policy.calculate_payment(self)
+        self.last_payment = self.payment_policy.calculate_payment(self)
+        return self.last_payment
 
-    @abstractmethod
-    def accept(self, visitor: EmployeeVisitor): pass
+    # Cada subclase indica qué método visit_* le corresponde
+    _VISIT = None
+
+    def accept(self, visitor: EmployeeVisitor):
+        return getattr(visitor, self._VISIT)(self)
 
     def log_transaction(self, type_op, amount, description):
-        self.transactions.append({
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "type": type_op,
-            "amount": amount,
-            "description": description
-        })
+        # Ninguno de estos append puede fallar, así las columnas nunca quedan desfasadas
+        self._ts.append(time.time_ns())
+        self._types.append(type_op)
+        self._amounts.append(amount)
+        self._descs.append(description)
+
+    @property
+    def transactions(self) -> List[Txn]:
+        return list(map(Txn, self._ts, self._types, self._amounts, self._descs))
 
     def show_transactions(self):
-        print(f"--- Historial de transacciones de {self.name} ---")
-        for t in sorted(self.transactions, key=lambda x: x["date"], reverse=True):
-            print(f"{t['date']} | {t['type']} | ${t['amount']} | {t['description']}")
+        buf = io.StringIO()
+        buf.write(f"--- Historial de transacciones de {self.name} ---\n")
+        # log_transaction solo agrega al final, la lista ya está en orden cronológico
+        rows = zip(reversed(self._ts), reversed(self._types), reversed(self._amounts), reversed(self._descs))
+        for ts, type_op, amount, description in rows:
+            buf.write(f"{_format_ts(ts)} | {type_op} | ${amount} | {description}\n")
+        sys.stdout.write(buf.getvalue())
 
     def can_request_vacation(self) -> bool:
         return True
 
 class SalariedEmployee(Employee):
+    __slots__ = ("salary",)
+    _VISIT = "visit_salaried"
+
     def __init__(self, name, role, salary, vacation_policy, payment_policy):
         super().__init__(name, role, vacation_policy, payment_policy)
         self.salary = salary
 
-    def accept(self, visitor: EmployeeVisitor):
-        return visitor.visit_salaried(self)
-
 class HourlyEmployee(Employee):
+    __slots__ = ("rate", "hours")
+    _VISIT = "visit_hourly"
+
     def __init__(self, name, role, rate, hours, vacation_policy, payment_policy):
         super().__init__(name, role, vacation_policy, payment_policy)
         self.rate = rate
         self.hours = hours
 
-    def accept(self, visitor: EmployeeVisitor):
-        return visitor.visit_hourly(self)
-
 class Freelancer(Employee):
-    def __init__(self, name, projects, vacation_policy, payment_policy):
-        super().__init__(name, "freelancer", vacation_policy, payment_policy)
-        self.projects = projects
+    __slots__ = ("project_names", "project_amounts")
+    _VISIT = "visit_freelancer"
 
-    def accept(self, visitor: EmployeeVisitor):
-        return visitor.visit_freelancer(self)
+    def __init__(self, name, project_names, project_amounts, vacation_policy, payment_policy):
+        super().__init__(name, ROLE_FREELANCER, vacation_policy, payment_policy)
+        self.project_names: List[str] = list(project_names)
+        self.project_amounts = _float_array(project_amounts)
 
     def can_request_vacation(self) -> bool:
         return False
 
 class Intern(Employee):
-    def __init__(self, name, vacation_policy, payment_policy):
-        super().__init__(name, "intern", vacation_policy, payment_policy)
+    __slots__ = ()
+    _VISIT = "visit_intern"
 
-    def accept(self, visitor: EmployeeVisitor):
-        return visitor.visit_intern(self)
+    def __init__(self, name, vacation_policy, payment_policy):
+        super().__init__(name, ROLE_INTERN, vacation_policy, payment_policy)
 
     def can_request_vacation(self) -> bool:
         return False
 
+# Recorrido por lotes: una tabla tipo -> método del visitor armada una sola vez
+
+def visit_all(visitor: EmployeeVisitor, employees):
+    table = {
+        SalariedEmployee: visitor.visit_salaried,
+        HourlyEmployee: visitor.visit_hourly,
+        Freelancer: visitor.visit_freelancer,
+        Intern: visitor.visit_intern,
+    }
+    results = []
+    for employee in employees:
+        handler = table.get(type(employee))
+        results.append(handler(employee) if handler is not None else employee.accept(visitor))
+    return results
+
 # Políticas de pago
 
 class SalariedPaymentPolicy(PaymentPolicy):
+    __slots__ = ("bonus_percent", "_desc")
+
     def __init__(self, bonus_percent=0.10):
         self.bonus_percent = bonus_percent
+        self._desc = f"Salaried + {bonus_percent*100:.0f}% bonus"
 
     def calculate_payment(self, employee):
-        bonus = employee.salary * self.bonus_percent
-        total = employee.salary + bonus
-        employee.log_transaction("payment", total, f"Salaried + {self.bonus_percent*100:.0f}% bonus")
+        salary = employee.salary
+        total = salary + salary * self.bonus_percent
+        employee.log_transaction("payment", total, self._desc)
         return total
 
+    def calculate_batch(self, employees):
+        np = _numpy()
+        if np is None:
+            return super().calculate_batch(employees)
+        # Cualquier fallo del cálculo vectorizado (datos, pago.json, JIT) vuelve al pago por empleado
+        try:
+            salaries = np.fromiter((e.salary for e in employees), dtype=np.float64, count=len(employees))
+            if not np.isfinite(salaries).all():  # fromiter convierte None en nan
+                return super().calculate_batch(employees)
+            totals = _salaried_totals(salaries, self.bonus_percent).tolist()
+        except Exception:
+            return super().calculate_batch(employees)
+        description = self._desc
+        for employee, total in zip(employees, totals):
+            employee.log_transaction("payment", total, description)
+        return totals
+
 class HourlyPaymentPolicy(PaymentPolicy):
+    __slots__ = ("bonus_threshold", "bonus_amount", "_desc_bonus", "_desc_nobonus")
+
     def __init__(self, bonus_threshold=160, bonus_amount=100):
         self.bonus_threshold = bonus_threshold
         self.bonus_amount = bonus_amount
+        self._desc_bonus = f" + bonus ${bonus_amount}"
+        self._desc_nobonus = " + bonus $0"
 
     def calculate_payment(self, employee):
-        base = employee.rate * employee.hours
-        bonus = self.bonus_amount if employee.hours > self.bonus_threshold else 0
-        total = base + bonus
-        employee.log_transaction("payment", total, f"Hourly ({employee.hours} hours) + bonus ${bonus}")  #GOTTA CHECK THIS THING TOO
+        hours = employee.hours
+        if hours > self.bonus_threshold:
+            bonus, suffix = self.bonus_amount, self._desc_bonus
+        else:
+            bonus, suffix = 0, self._desc_nobonus
+        total = employee.rate * hours + bonus
+        employee.log_transaction("payment", total, f"Hourly ({hours} hours){suffix}")  #GOTTA CHECK THIS THING TOO
         return total
 
+    def calculate_batch(self, employees):
+        np = _numpy()
+        if np is None:
+            return super().calculate_batch(employees)
+        n = len(employees)
+        threshold, bonus_amount = self.bonus_threshold, self.bonus_amount
+        # Cualquier fallo del cálculo vectorizado (datos, pago.json, JIT) vuelve al pago por empleado
+        try:
+            rates = np.fromiter((e.rate for e in employees), dtype=np.float64, count=n)
+            hours = np.fromiter((e.hours for e in employees), dtype=np.float64, count=n)
+            if not (np.isfinite(rates).all() and np.isfinite(hours).all()):
+                return super().calculate_batch(employees)
+            totals = _hourly_totals(rates, hours, threshold, bonus_amount).tolist()
+            has_bonus = (hours > threshold).tolist()
+        except Exception:
+            return super().calculate_batch(employees)
+        # El registro queda fuera del try: si fallara a medias, el reintento duplicaría pagos
+        desc_bonus, desc_nobonus = self._desc_bonus, self._desc_nobonus
+        for employee, total, bonus in zip(employees, totals, has_bonus):
+            suffix = desc_bonus if bonus else desc_nobonus
+            employee.log_transaction("payment", total, f"Hourly ({employee.hours} hours){suffix}")
+        return totals
+
 class FreelancerPaymentPolicy(PaymentPolicy):
+    __slots__ = ()
+
     def calculate_payment(self, employee):
-        total = sum(p["amount"] for p in employee.projects)
+        total = _project_total(employee.project_amounts)
         employee.log_transaction("payment", total, "Freelancer project payout")
         return total
 
+    def calculate_batch(self, employees):
+        try:
+            totals = [_project_total(e.project_amounts) for e in employees]
+        except Exception:
+            return super().calculate_batch(employees)
+        for employee, total in zip(employees, totals):
+            employee.log_transaction("payment", total, "Freelancer project payout")
+        return totals
+
 class InternPaymentPolicy(PaymentPolicy):
+    __slots__ = ()
+
     def calculate_payment(self, employee):
         employee.log_transaction("payment", 0, "Interns not paid")
         return 0
 
 # Políticas de vacaciones
 
+# Errores precreados para validate()/try_request_vacation(), que no lanzan;
+# request_vacation lanza una copia nueva para no compartir estado entre excepciones
+INTERN_FORBIDDEN = VacationError("Interns cannot take vacations or payouts.")
+FREELANCER_FORBIDDEN = VacationError("Freelancers no pueden tomar vacaciones ni recibir payout.")
+MANAGER_PAYOUT_LIMIT = VacationError("Managers can only request up to 10 days payout.")
+VP_DAYS_LIMIT = VacationError("VPs can only request 5 days per request.")
+NOT_ENOUGH_DAYS = VacationError("Not enough vacation days.")
+
 class InternVacationPolicy(VacationPolicy):
-    def request_vacation(self, employee, days, payout):
-        raise Exception("Interns cannot take vacations or payouts.")
+    __slots__ = ()
+
+    def validate(self, employee, days, payout):
+        return INTERN_FORBIDDEN
 
 class ManagerVacationPolicy(VacationPolicy):
-    def request_vacation(self, employee, days, payout):
+    __slots__ = ()
+
+    def validate(self, employee, days, payout):
         if payout and days > 10:
-            raise Exception("Managers can only request up to 10 days payout.")
+            return MANAGER_PAYOUT_LIMIT
         if employee.vacation_days < days:
-            raise Exception("Not enough vacation days.")
+            return NOT_ENOUGH_DAYS
+        return None
+
+    def grant(self, employee, days, payout):
         employee.vacation_days -= days
         employee.log_transaction("vacation", days, "Manager vacation/payout")
 
 class VPVacationPolicy(VacationPolicy):
-    def request_vacation(self, employee, days, payout):
+    __slots__ = ()
+
+    def validate(self, employee, days, payout):
         if days > 5:
-            raise Exception("VPs can only request 5 days per request.")
+            return VP_DAYS_LIMIT
+        return None
+
+    def grant(self, employee, days, payout):
         employee.log_transaction("vacation", days, "VP vacation/payout")
 
 class DefaultVacationPolicy(VacationPolicy):
-    def request_vacation(self, employee, days, payout):  #EVALUAR SI DEBO DEJAR ESTA COSA O NO 
+    __slots__ = ()
+
+    def validate(self, employee, days, payout):  #EVALUAR SI DEBO DEJAR ESTA COSA O NO 
         if employee.vacation_days < days:
-            raise Exception("Not enough vacation days.")
+            return NOT_ENOUGH_DAYS
+        return None
+
+    def grant(self, employee, days, payout):
         employee.vacation_days -= days
         employee.log_transaction("vacation", days, "Standard vacation/payout")
 
 class FreelancerVacationPolicy(VacationPolicy):
-    def request_vacation(self, employee, days, payout):
-        raise Exception("Freelancers no pueden tomar vacaciones ni recibir payout.")
+    __slots__ = ()
+
+    def validate(self, employee, days, payout):
+        return FREELANCER_FORBIDDEN
+
+# Las políticas de vacaciones no guardan estado: una instancia compartida por tipo
+MANAGER_VAC_POLICY = ManagerVacationPolicy()
+VP_VAC_POLICY = VPVacationPolicy()
+DEFAULT_VAC_POLICY = DefaultVacationPolicy()
+INTERN_VAC_POLICY = InternVacationPolicy()
+FREELANCER_VAC_POLICY = FreelancerVacationPolicy()
+
+# Nómina por lotes: agrupa por política de pago y delega el cálculo vectorizado en ella
+
+class PayrollBatch:
+    __slots__ = ("employees",)
+
+    def __init__(self, employees):
+        self.employees = employees
+
+    def run(self):
+        groups = {}
+        for employee in self.employees:
+            groups.setdefault(employee.payment_policy, []).append(employee)
+
+        results = {}
+        for policy, group in groups.items():
+            try:
+                totals = policy.calculate_batch(group)
+            except Exception:
+                # Si el lote entero falla, se paga empleado por empleado y cada error queda aislado
+                totals = PaymentPolicy.calculate_batch(policy, group)
+            for employee, total in zip(group, totals):
+                results[id(employee)] = total
+
+        # (empleado, total, error) en el orden original
+        payroll = []
+        for employee in self.employees:
+            total = results[id(employee)]
+            if isinstance(total, Exception):
+                payroll.append((employee, None, total))
+            else:
+                employee.last_payment = total
+                payroll.append((employee, total, None))
+        return payroll
 
 # Cargador de configuración
 
-def load_payment_policies_from_json(path="pago.json"):
-    with open(path, "r") as f:
-        config = json.load(f)
+def _load_raw(abspath):
+    # Imports diferidos: el parser solo se carga si realmente hay que leer el archivo.
+    try:
+        import orjson as _json  # parser opcional en C, más rápido que json
+    except ImportError:
+        import json as _json
+    with open(abspath, "rb") as f:
+        return _json.loads(f.read())
+
+@functools.lru_cache(maxsize=8)
+def _load_policies(abspath, mtime):
+    # La clave incluye el mtime para que editar pago.json invalide la caché.
+    config = _load_raw(abspath)
     return {
         "salaried": SalariedPaymentPolicy(config["salaried"]["bonus_percent"]),
         "hourly": HourlyPaymentPolicy(config["hourly"]["bonus_threshold"], config["hourly"]["bonus_amount"]),
         "freelancer": FreelancerPaymentPolicy(),
         "intern": InternPaymentPolicy()
     }
+
+@functools.lru_cache(maxsize=1)
+def _build_defaults():
+    return {
+        "salaried": SalariedPaymentPolicy(),
+        "hourly": HourlyPaymentPolicy(),
+        "freelancer": FreelancerPaymentPolicy(),
+        "intern": InternPaymentPolicy()
+    }
+
+def load_payment_policies_from_json(path="pago.json"):
+    abspath = os.path.abspath(path)
+    # Sin archivo (o vacío) se usan los valores por defecto sin abrir ni parsear nada
+    try:
+        st = os.stat(abspath)
+    except FileNotFoundError:
+        return dict(_build_defaults())
+    if st.st_size == 0:
+        return dict(_build_defaults())
+    # Las políticas no guardan estado por empleado: se comparten, solo se copia el dict
+    return dict(_load_policies(abspath, st.st_mtime_ns))
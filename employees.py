@@ -1,7 +1,9 @@
 
 import os
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List
+from typing import DefaultDict, List
 
 FIXED_VACATION_DAYS_PAYOUT = 5  # The fixed nr of vacation days that can be paid out.
 
@@ -58,34 +60,24 @@ class Company:
 
     def __init__(self) -> None:
         self.employees: List[Employee] = []
+        self.employees_by_role: DefaultDict[str, List[Employee]] = defaultdict(list)
 
     def add_employee(self, employee: Employee) -> None:
         """Add an employee to the list of employees."""
         self.employees.append(employee)
+        self.employees_by_role[employee.role].append(employee)
 
     def find_managers(self) -> List[Employee]:
         """Find all manager employees."""
-        managers = []
-        for employee in self.employees:
-            if employee.role == "manager":
-                managers.append(employee)
-        return managers
+        return list(self.employees_by_role.get("manager", ()))
 
     def find_vice_presidents(self) -> List[Employee]:
         """Find all vice-president employees."""
-        vice_presidents = []
-        for employee in self.employees:
-            if employee.role == "vice_president":
-                vice_presidents.append(employee)
-        return vice_presidents
+        return list(self.employees_by_role.get("vice_president", ()))
 
     def find_interns(self) -> List[Employee]:
         """Find all interns."""
-        interns = []
-        for employee in self.employees:
-            if employee.role == "intern":
-                interns.append(employee)
-        return interns
+        return list(self.employees_by_role.get("intern", ()))
 
     def pay_employee(self, employee: Employee) -> None:
         """Pay an employee."""
@@ -100,113 +92,143 @@ class Company:
 
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal with an ANSI escape instead of spawning cls/clear."""
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+def emit(lines: List[str]) -> None:
+    """Write all lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
+
+def create_employee_menu(company: Company) -> None:
+    """Ask for the employee data and add the new employee to the company."""
+    name = input("Employee name: ")
+    role = input("Role (intern, manager, vice_president): ").lower()
+    emp_type = input("Employee type (salaried/hourly): ").lower()
+
+    if emp_type == "salaried":
+        try:
+            salary = float(input("Monthly salary: "))
+            employee = SalariedEmployee(name=name, role=role, monthly_salary=salary)
+        except ValueError:
+            print("Invalid salary input.")
+            input("Press Enter to continue...")
+            return
+    elif emp_type == "hourly":
+        try:
+            rate = float(input("Hourly rate: "))
+            hours = int(input("Hours worked: "))
+            employee = HourlyEmployee(name=name, role=role, hourly_rate=rate, amount=hours)
+        except ValueError:
+            print("Invalid hourly input.")
+            input("Press Enter to continue...")
+            return
+    else:
+        print("Invalid employee type.")
+        input("Press Enter to continue...")
+        return
+
+    company.add_employee(employee)
+    print("Employee created successfully.")
+    input("Press Enter to continue...")
+
+
+def view_employees_menu(company: Company) -> None:
+    """Show the employees of the chosen role until the user goes back."""
+    while True:
+        clear_screen() #establishes a clear screen for better visibility
+        emit([
+            "--- View Employees Submenu ---",
+            "1. View managers",
+            "2. View interns",#this is used to view the interns
+            "3. View vice presidents",
+            "0. Return to main menu",
+        ])
+
+        sub_choice = input("Select an option: ")
+
+        if sub_choice == "1":
+            managers = company.find_managers()
+            emit([f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days" for emp in managers])
+        elif sub_choice == "2":
+            interns = company.find_interns()
+            emit([f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days" for emp in interns])
+        elif sub_choice == "3":
+            vps = company.find_vice_presidents()
+            emit([f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days" for emp in vps])
+        elif sub_choice == "0":
+            break
+        else:
+            print("Invalid option.")
+        input("Press Enter to continue...")
+
+
+def grant_vacation_menu(company: Company) -> None:
+    """Let the selected employee take a holiday or a payout."""
+    clear_screen()
+    if not company.employees:
+        print("No employees available.")
+        input("Press Enter to continue...")
+        return
+
+    emit([f"{idx}. {emp.name} ({emp.role}) - {emp.vacation_days} vacation days"
+          for idx, emp in enumerate(company.employees)])
+    try:
+        idx = int(input("Select employee index: "))
+        payout = input("Payout instead of time off? (y/n): ").lower() == "y"
+        company.employees[idx].take_a_holiday(payout)
+    except (IndexError, ValueError) as e:
+        print(f"Error: {e}")
+    input("Press Enter to continue...")
+
+
+def pay_employees_menu(company: Company) -> None:
+    """Pay every employee of the company."""
+    clear_screen()
+    for emp in company.employees:
+        company.pay_employee(emp)
+    input("Press Enter to continue...")
+
+
+def invalid_option(company: Company) -> None:
+    """Tell the user the chosen option doesn't exist."""
+    print("Invalid option.")
+    input("Press Enter to continue...")
+
+
+MENU_HANDLERS = {
+    "1": create_employee_menu,
+    "2": view_employees_menu,
+    "3": grant_vacation_menu,
+    "4": pay_employees_menu,
+}
+
 
 def main(): #-----------------------------Tis is the main function-----------------------------------
     #It helps to manage the employee management system.
     company = Company()
+    if os.name == "nt":
+        os.system("")  # enables ANSI escape processing in the Windows console
 
     while True:
         clear_screen()
-        print("--- Employee Management Menu ---")
-        print("1. Create employee")
-        print("2. View employees")
-        print("3. Grant vacation to an employee")
-        print("4. Pay employees")
-        print("5. Exit")
+        emit([
+            "--- Employee Management Menu ---",
+            "1. Create employee",
+            "2. View employees",
+            "3. Grant vacation to an employee",
+            "4. Pay employees",
+            "5. Exit",
+        ])
 
         choice = input("Select an option: ")
 
-        if choice == "1":
-            name = input("Employee name: ")
-            role = input("Role (intern, manager, vice_president): ").lower()
-            emp_type = input("Employee type (salaried/hourly): ").lower()
-
-            if emp_type == "salaried":
-                try:
-                    salary = float(input("Monthly salary: "))
-                    employee = SalariedEmployee(name=name, role=role, monthly_salary=salary)
-                except ValueError:
-                    print("Invalid salary input.")
-                    input("Press Enter to continue...")
-                    continue
-            elif emp_type == "hourly":
-                try:
-                    rate = float(input("Hourly rate: "))
-                    hours = int(input("Hours worked: "))
-                    employee = HourlyEmployee(name=name, role=role, hourly_rate=rate, amount=hours)
-                except ValueError:
-                    print("Invalid hourly input.")
-                    input("Press Enter to continue...")
-                    continue
-            else:
-                print("Invalid employee type.")
-                input("Press Enter to continue...")
-                continue
-
-            company.add_employee(employee)
-            print("Employee created successfully.")
-            input("Press Enter to continue...")
-
-        elif choice == "2":
-            while True:
-                clear_screen() #establishes a clear screen for better visibility
-                print("--- View Employees Submenu ---")
-                print("1. View managers")
-                print("2. View interns")#this is used to view the interns
-                print("3. View vice presidents")
-                print("0. Return to main menu")
-
-                sub_choice = input("Select an option: ")
-
-                if sub_choice == "1":
-                    managers = company.find_managers()
-                    for emp in managers:
-                        print(f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days")
-                elif sub_choice == "2":
-                    interns = company.find_interns()
-                    for emp in interns:
-                        print(f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days")
-                elif sub_choice == "3":
-                    vps = company.find_vice_presidents()
-                    for emp in vps:
-                        print(f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days")
-                elif sub_choice == "0":
-                    break
-                else:
-                    print("Invalid option.")
-                input("Press Enter to continue...")
-
-        elif choice == "3":
-            clear_screen()
-            if not company.employees:
-                print("No employees available.")
-                input("Press Enter to continue...")
-                continue
-
-            for idx, emp in enumerate(company.employees):
-                print(f"{idx}. {emp.name} ({emp.role}) - {emp.vacation_days} vacation days")
-            try:
-                idx = int(input("Select employee index: "))
-                payout = input("Payout instead of time off? (y/n): ").lower() == "y"
-                company.employees[idx].take_a_holiday(payout)
-            except (IndexError, ValueError) as e:
-                print(f"Error: {e}")
-            input("Press Enter to continue...")
-
-        elif choice == "4":
-            clear_screen()
-            for emp in company.employees:
-                company.pay_employee(emp)
-            input("Press Enter to continue...")
-
-        elif choice == "5":
+        if choice == "5":
             print("Goodbye!")
             break
-
-        else:
-            print("Invalid option.")
-            input("Press Enter to continue...")
+        MENU_HANDLERS.get(choice, invalid_option)(company)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,27 @@
 import os
+import sys
+from collections import defaultdict
 from RefEmployees import (
     SalariedEmployee, HourlyEmployee, Freelancer, Intern,
-    ManagerVacationPolicy, VPVacationPolicy, DefaultVacationPolicy, InternVacationPolicy, FreelancerVacationPolicy,
-    load_payment_policies_from_json
+    MANAGER_VAC_POLICY, VP_VAC_POLICY, DEFAULT_VAC_POLICY, INTERN_VAC_POLICY, FREELANCER_VAC_POLICY,
+    ROLE_MANAGER, ROLE_VP, ROLE_INTERN, ROLE_FREELANCER,
+    PayrollBatch, load_payment_policies_from_json
 )
 
+# Las políticas no guardan estado por empleado, así que la tabla se arma una sola vez
+_VACATION_POLICIES = {
+    ROLE_MANAGER: MANAGER_VAC_POLICY,
+    ROLE_VP: VP_VAC_POLICY,
+    ROLE_INTERN: INTERN_VAC_POLICY,
+    ROLE_FREELANCER: FREELANCER_VAC_POLICY
+}
+
+def _emit(lines):
+    # Una sola escritura por pantalla en lugar de un print por línea
+    if lines:
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
+
 class EmployeeFactory:
     def __init__(self, policies):
         self.policies = policies
@@ -22,69 +39,72 @@ class EmployeeFactory:
             return HourlyEmployee(name, role, rate, hours, vac_policy, self.policies["hourly"])
 
         elif emp_type == "freelancer":
-            projects = []
+            project_names, project_amounts = [], []
             while True:
                 pname = input("Nombre del proyecto (o 'fin' para terminar): ") #ROMPER FLUJO B Y LLEVARLO AL FLUJO INICIAL AL CREAR ROL
                 if pname.lower() == "fin":
                     break
                 amount = float(input("Monto del proyecto: "))
-                projects.append({"name": pname, "amount": amount})
-            return Freelancer(name, projects, DefaultVacationPolicy(), self.policies["freelancer"])
+                project_names.append(pname)
+                project_amounts.append(amount)
+            return Freelancer(name, project_names, project_amounts, DEFAULT_VAC_POLICY, self.policies["freelancer"])
 
         elif emp_type == "intern":
-            return Intern(name, InternVacationPolicy(), self.policies["intern"])
+            return Intern(name, INTERN_VAC_POLICY, self.policies["intern"])
 
         else:
             raise ValueError("Tipo de empleado no válido.")
 
     def _get_vacation_policy(self, role):
-        policies = {
-            "manager": ManagerVacationPolicy(),
-            "vice_president": VPVacationPolicy(),
-            "intern": InternVacationPolicy(),
-            "freelancer": FreelancerVacationPolicy()
-        }
-        return policies.get(role, DefaultVacationPolicy())
+        return _VACATION_POLICIES.get(role, DEFAULT_VAC_POLICY)
 
 
 class EmployeeManager:
     def __init__(self):
         self.employees = []
+        self.employees_by_role = defaultdict(list)
+        # can_request_vacation() depende solo de la clase: se decide al crear el empleado
+        self._vacation_eligible = []
         self.policies = load_payment_policies_from_json()
         self.factory = EmployeeFactory(self.policies)
 
     def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Secuencia ANSI: borra y vuelve al inicio sin lanzar un proceso cls/clear
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
     def run(self):
+        handlers = {
+            "1": self.create_employee,
+            "2": self.view_by_role,
+            "3": self.request_vacation,
+            "4": self.pay_employees,
+            "5": self.view_transactions,
+        }
+        if os.name == "nt":
+            os.system("")  # activa el procesamiento de secuencias ANSI en la consola de Windows
         while True:
             self.clear_screen()
-            print("--- Menú de Gestión de Empleados ---")
-            print("1. Crear empleado")
-            print("2. Ver empleados por rol")
-            print("3. Solicitar vacaciones")
-            print("4. Pagar empleados")
-            print("5. Ver historial de transacciones")
-            print("0. Salir")
+            _emit((
+                "--- Menú de Gestión de Empleados ---",
+                "1. Crear empleado",
+                "2. Ver empleados por rol",
+                "3. Solicitar vacaciones",
+                "4. Pagar empleados",
+                "5. Ver historial de transacciones",
+                "0. Salir",
+            ))
 
             choice = input("Seleccione una opción: ")
 
-            if choice == "1":
-                self.create_employee()
-            elif choice == "2":
-                self.view_by_role()
-            elif choice == "3":
-                self.request_vacation()
-            elif choice == "4":
-                self.pay_employees()
-            elif choice == "5":
-                self.view_transactions()
-            elif choice == "0":
+            if choice == "0":
                 print("¡Hasta luego!")
                 break
-            else:
-                print("Opción no válida.")
-                input("Presione Enter para continuar...")
+            handlers.get(choice, self._invalid_option)()
+
+    def _invalid_option(self):
+        print("Opción no válida.")
+        input("Presione Enter para continuar...")
 
     def create_employee(self):
         name = input("Nombre del empleado: ")
@@ -98,6 +118,9 @@ class EmployeeManager:
         try:
             employee = self.factory.create_employee(name, role, emp_type)
             self.employees.append(employee)
+            self.employees_by_role[employee.role].append(employee)
+            if employee.can_request_vacation():
+                self._vacation_eligible.append(employee)
             print("Empleado creado exitosamente.")
         except Exception as e:
             print(f"Error: {e}")
@@ -107,27 +130,29 @@ class EmployeeManager:
     def view_by_role(self):
         while True:
             self.clear_screen()
-            print("--- Submenú de Visualización de Empleados ---")
-            print("1. Ver managers")
-            print("2. Ver interns")
-            print("3. Ver vice presidents")
-            print("4. Ver freelancers")
-            print("5. Ver todos los empleados")
-            print("0. Volver al menú principal")
+            _emit((
+                "--- Submenú de Visualización de Empleados ---",
+                "1. Ver managers",
+                "2. Ver interns",
+                "3. Ver vice presidents",
+                "4. Ver freelancers",
+                "5. Ver todos los empleados",
+                "0. Volver al menú principal",
+            ))
 
             sub_choice = input("Seleccione una opción: ")
 
             if sub_choice == "1":
-                self._print_employees_by_role("manager")
+                self._print_employees_by_role(ROLE_MANAGER)
             elif sub_choice == "2":
-                self._print_employees_by_role("intern") 
+                self._print_employees_by_role(ROLE_INTERN) 
             elif sub_choice == "3":
-                self._print_employees_by_role("vice_president")
+                self._print_employees_by_role(ROLE_VP)
             elif sub_choice == "4":
-                self._print_employees_by_role("freelancer")
+                self._print_employees_by_role(ROLE_FREELANCER)
             elif sub_choice == "5":
-                for emp in self.employees:
-                    print(f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days")   
+                _emit([f"{emp.name} ({emp.role}) - {emp.vacation_days} vacation days"
+                       for emp in self.employees])
             elif sub_choice == "0":
                 break
             else:
@@ -135,27 +160,30 @@ class EmployeeManager:
             input("Presione Enter para continuar...")
 
     def _print_employees_by_role(self, role):
-        for emp in self.employees:
-            if emp.role == role:
-                print(f"{emp.name} ({emp.role}) - {emp.vacation_days} días de vacaciones")
+        _emit([f"{emp.name} ({emp.role}) - {emp.vacation_days} días de vacaciones"
+               for emp in self.employees_by_role.get(role, ())])
 
     def request_vacation(self):
         self.clear_screen()
-        valid_employees = [emp for emp in self.employees if emp.can_request_vacation()]
+        valid_employees = self._vacation_eligible
 
         if not valid_employees:
             print("No hay empleados elegibles para vacaciones.")
             input("Presione Enter para continuar...")
             return
 
-        for idx, emp in enumerate(valid_employees):
-            print(f"{idx}. {emp.name} ({emp.role}) - {emp.vacation_days} días de vacaciones")
+        _emit([f"{idx}. {emp.name} ({emp.role}) - {emp.vacation_days} días de vacaciones"
+               for idx, emp in enumerate(valid_employees)])
 
         try:
             idx = int(input("Seleccione el índice del empleado: "))
             days = int(input("Días de vacaciones: "))
             payout = input("¿Payout en lugar de tiempo libre? (s/n): ").lower() == "s"
-            valid_employees[idx].request_vacation(days, payout)
+            error = valid_employees[idx].try_request_vacation(days, payout)
+            if error is not None:
+                print(f"Error: {error}")
+                input("Presione Enter para continuar...")
+                return
             print("Vacaciones registradas.")
         except Exception as e:
             print(f"Error: {e}")
@@ -164,18 +192,13 @@ class EmployeeManager:
 
     def pay_employees(self):
         self.clear_screen()
-        for emp in self.employees:
-            try:
-                total = emp.calculate_payment()
-                print(f"{emp.name} recibió ${total}")
-            except Exception as e:
-                print(f"Error al pagar a {emp.name}: {e}")
+        _emit([f"{emp.name} recibió ${total}" if error is None else f"Error al pagar a {emp.name}: {error}"
+               for emp, total, error in PayrollBatch(self.employees).run()])
         input("Presione Enter para continuar...")
 
     def view_transactions(self):
         self.clear_screen()
-        for idx, emp in enumerate(self.employees):
-            print(f"{idx}. {emp.name} ({emp.role})")
+        _emit([f"{idx}. {emp.name} ({emp.role})" for idx, emp in enumerate(self.employees)])
         try:
             idx = int(input("Seleccione el índice del empleado: "))
             self.employees[idx].show_transactions() 